@@ -1,13 +1,12 @@
-from rustshed import to_result
+from rustshed import Err, Ok, Result
 
 
 class ParseIntError(ValueError):
     """An error which can be returned when parsing an integer."""
 
 
-@to_result[ParseIntError]
-def parse(s: str) -> int:
+def parse(s: str) -> Result[int, ParseIntError]:
     try:
-        return int(s)
+        return Ok(int(s))
     except ValueError as err:
-        raise ParseIntError(str(err)) from None
+        return Err(ParseIntError(str(err)))
@@ -0,0 +1,25 @@
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+W = TypeVar("W")
+
+
+def shared_wrapper(wrap: Callable[[Any], W]) -> Callable[[Any], W]:
+    """
+    Returns `wrap` reusing its results for None, True and False.
+
+    `Some` and `Ok` are immutable, so the wrappers of these values, which
+    converted functions return most often, can be built once and shared.
+    """
+    none, true, false = wrap(None), wrap(True), wrap(False)
+
+    def wrapper(value: Any) -> W:
+        if value is None:
+            return none
+        if value is True:
+            return true
+        if value is False:
+            return false
+        return wrap(value)
+
+    return wrapper
@@ -0,0 +1,361 @@
+"""
+Compile-time expansion of the Q operator.
+
+The shortcut decorators recompile the decorated function so that statements
+of the form `x = expr.Q`, `return expr.Q` and `expr.Q` become explicit
+early returns, e.g. for `result_shortcut`:
+
+```
+__rustshed_q = expr
+if __rustshed_q.__class__ is Ok:
+    x = __rustshed_q.value
+elif __rustshed_q.__class__ is Err:
+    return __rustshed_q
+else:
+    x = __rustshed_q.Q
+```
+
+and likewise with `Some` and `NullType` for `option_shortcut`.
+
+This way the error path no longer has to raise and catch an exception
+and the success path skips the `Q` property.
+Any other use of `.Q` is left as it is and still handled by the exception
+based protocol, which the rewritten function keeps as a fallback.
+
+The source is only rewritten if compiling it unchanged reproduces the code
+of the decorated function, so e.g. a file edited after it was imported is
+not picked up.
+
+The rewritten function refers to the `__rustshed_*` names it needs as
+closure variables and to `__rustshed_q` as a local variable, so they show
+up in its `locals()`.
+"""
+
+import __future__
+
+import ast
+import copy
+import inspect
+import sys
+import textwrap
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import reduce, update_wrapper
+from operator import attrgetter
+from types import CellType, CodeType, FunctionType
+from typing import Any, TypeVar
+from weakref import WeakKeyDictionary
+
+from rustshed.option_result import (
+    Err,
+    Null,
+    NullType,
+    Ok,
+    OptionShortcutError,
+    ResultShortcutError,
+    Some,
+)
+
+C = TypeVar("C", bound=Callable[..., Any])
+
+
+@dataclass(frozen=True, slots=True)
+class Shortcut:
+    """The early return protocol of a shortcut decorator."""
+
+    # the class whose `.value` the Q operator unwraps
+    success: type
+    # the class whose instances the Q operator returns early
+    failure: type
+    # the exception raised by the Q operator of `failure`
+    error: type[Exception]
+    # maps a caught `error` to the value returned from the function
+    unwind: Callable[[Any], Any]
+
+
+RESULT = Shortcut(Ok, Err, ResultShortcutError, attrgetter("error"))
+OPTION = Shortcut(Some, NullType, OptionShortcutError, lambda _: Null)
+
+_TMP = "__rustshed_q"
+_SUCCESS = "__rustshed_success"
+_FAILURE = "__rustshed_failure"
+_ERROR = "__rustshed_error"
+_UNWIND = "__rustshed_unwind"
+_CAUGHT = "__rustshed_caught"
+_FACTORY = "__rustshed_factory"
+
+_INJECTED = (_SUCCESS, _FAILURE, _ERROR, _UNWIND)
+
+_FUTURE_FLAGS = reduce(
+    int.__or__,
+    (getattr(__future__, name).compiler_flag for name in __future__.all_feature_names),
+    0,
+)
+
+_SUSPENDABLE = inspect.CO_GENERATOR | inspect.CO_COROUTINE | inspect.CO_ASYNC_GENERATOR
+
+# Returning from these blocks is observable (e.g. by a context manager's
+# `__exit__` or an `except Exception` clause), so `.Q` inside them keeps
+# raising as before.
+_OPAQUE_BLOCKS: tuple[type[ast.AST], ...] = (
+    ast.Try,
+    ast.With,
+    ast.AsyncWith,
+    ast.FunctionDef,
+    ast.AsyncFunctionDef,
+    ast.ClassDef,
+)
+if sys.version_info >= (3, 11):
+    _OPAQUE_BLOCKS += (ast.TryStar,)
+
+
+def _q_operand(node: ast.expr | None) -> ast.expr | None:
+    """Returns `expr` if the node is `expr.Q`."""
+    if (
+        isinstance(node, ast.Attribute)
+        and node.attr == "Q"
+        and isinstance(node.ctx, ast.Load)
+    ):
+        return node.value
+    return None
+
+
+def _is_class(node: ast.expr, name: str) -> ast.Compare:
+    return ast.Compare(
+        left=ast.Attribute(value=node, attr="__class__", ctx=ast.Load()),
+        ops=[ast.Is()],
+        comparators=[ast.Name(id=name, ctx=ast.Load())],
+    )
+
+
+def _with_value(
+    stmt: ast.Assign | ast.AnnAssign | ast.Return | ast.Expr, value: ast.expr
+) -> ast.stmt:
+    """Returns a copy of the `.Q` statement using `value` instead."""
+    stmt = copy.copy(stmt)
+    stmt.value = value
+    return stmt
+
+
+def _expand(
+    stmt: ast.Assign | ast.AnnAssign | ast.Return | ast.Expr, operand: ast.expr
+) -> list[ast.stmt]:
+    tmp = ast.Name(id=_TMP, ctx=ast.Load())
+    value = ast.Attribute(value=tmp, attr="value", ctx=ast.Load())
+    q = ast.Attribute(value=tmp, attr="Q", ctx=ast.Load())
+    expanded: list[ast.stmt] = [
+        ast.Assign(targets=[ast.Name(id=_TMP, ctx=ast.Store())], value=operand),
+        ast.If(
+            test=_is_class(tmp, _SUCCESS),
+            body=[_with_value(stmt, value)],
+            orelse=[
+                ast.If(
+                    test=_is_class(tmp, _FAILURE),
+                    body=[ast.Return(value=tmp)],
+                    orelse=[_with_value(stmt, q)],
+                )
+            ],
+        ),
+    ]
+    return [ast.copy_location(node, stmt) for node in expanded]
+
+
+def _rewrite_body(body: list[ast.stmt]) -> tuple[list[ast.stmt], int]:
+    rewritten: list[ast.stmt] = []
+    count = 0
+    for stmt in body:
+        if isinstance(stmt, (ast.Assign, ast.AnnAssign, ast.Return, ast.Expr)):
+            operand = _q_operand(stmt.value)
+            if operand is not None:
+                rewritten.extend(_expand(stmt, operand))
+                count += 1
+                continue
+
+        if not isinstance(stmt, _OPAQUE_BLOCKS):
+            for field in ("body", "orelse"):
+                block = getattr(stmt, field, None)
+                if block:
+                    new_block, block_count = _rewrite_body(block)
+                    setattr(stmt, field, new_block)
+                    count += block_count
+            for case in getattr(stmt, "cases", ()):
+                case.body, case_count = _rewrite_body(case.body)
+                count += case_count
+
+        rewritten.append(stmt)
+    return rewritten, count
+
+
+def _uses_private_names(tree: ast.AST) -> bool:
+    # names like `__x` are mangled inside classes,
+    # which recompiling outside of the class body would not reproduce
+    for node in ast.walk(tree):
+        name = getattr(node, "id", None) or getattr(node, "attr", None)
+        if isinstance(name, str) and name.startswith("__") and not name.endswith("__"):
+            return True
+    return False
+
+
+def _parse(f: FunctionType) -> ast.FunctionDef | None:
+    try:
+        source = textwrap.dedent(inspect.getsource(f))
+        module = ast.parse(source)
+    except (OSError, TypeError, SyntaxError):
+        return None
+
+    if len(module.body) != 1:
+        return None
+    func = module.body[0]
+    if not isinstance(func, ast.FunctionDef) or func.name != f.__name__:
+        return None
+
+    ast.increment_lineno(func, f.__code__.co_firstlineno - 1)
+    return func
+
+
+def _find_code(code: CodeType, name: str) -> CodeType | None:
+    for const in code.co_consts:
+        if isinstance(const, CodeType) and const.co_name == name:
+            return const
+    return None  # pragma: no cover
+
+
+# Positions are left out, as dedenting the source shifts their columns.
+_CODE_FIELDS = attrgetter(
+    "co_code",
+    "co_names",
+    "co_varnames",
+    "co_freevars",
+    "co_cellvars",
+    "co_argcount",
+    "co_posonlyargcount",
+    "co_kwonlyargcount",
+)
+
+
+def _same_code(code: CodeType, other: CodeType) -> bool:
+    if _CODE_FIELDS(code) != _CODE_FIELDS(other):
+        return False
+    # `f` may be defined at module level, where it is not nested in the factory
+    if (code.co_flags ^ other.co_flags) & ~inspect.CO_NESTED:
+        return False
+    if len(code.co_consts) != len(other.co_consts):
+        return False  # pragma: no cover
+    for const, other_const in zip(code.co_consts, other.co_consts):
+        if isinstance(const, CodeType) and isinstance(other_const, CodeType):
+            if not _same_code(const, other_const):
+                return False
+        elif const.__class__ is not other_const.__class__ or const != other_const:
+            return False
+    return True
+
+
+def _compile_function(func: ast.FunctionDef, f: FunctionType) -> CodeType | None:
+    # Free variables of `f` and the injected names become parameters of an
+    # enclosing factory, so the compiled function refers to them as closure
+    # cells which are then filled with `f`'s own cells.
+    params = [*f.__code__.co_freevars, *_INJECTED]
+    factory = ast.FunctionDef(
+        name=_FACTORY,
+        args=ast.arguments(
+            posonlyargs=[],
+            args=[ast.arg(arg=param) for param in params],
+            kwonlyargs=[],
+            kw_defaults=[],
+            defaults=[],
+        ),
+        body=[func, ast.Return(value=ast.Name(id=func.name, ctx=ast.Load()))],
+        decorator_list=[],
+    )
+    module = ast.fix_missing_locations(ast.Module(body=[factory], type_ignores=[]))
+
+    try:
+        module_code = compile(
+            module,
+            f.__code__.co_filename,
+            "exec",
+            flags=f.__code__.co_flags & _FUTURE_FLAGS,
+            dont_inherit=True,
+        )
+    except (SyntaxError, ValueError):  # pragma: no cover
+        return None
+
+    factory_code = _find_code(module_code, _FACTORY)
+    code = factory_code and _find_code(factory_code, func.name)
+    if code is None or code.co_argcount != f.__code__.co_argcount:
+        return None  # pragma: no cover
+    return code
+
+
+def _compile(f: FunctionType) -> CodeType | None:
+    func = _parse(f)
+    if func is None or _uses_private_names(func):
+        return None
+    func.decorator_list = []
+
+    # the source on disk may have changed since `f` was defined,
+    # in which case it is not the code that `f` runs
+    original = _compile_function(copy.deepcopy(func), f)
+    if original is None or not _same_code(original, f.__code__):
+        return None
+
+    body, count = _rewrite_body(func.body)
+    if not count:
+        return None
+
+    unwind = ast.Call(
+        func=ast.Name(id=_UNWIND, ctx=ast.Load()),
+        args=[ast.Name(id=_CAUGHT, ctx=ast.Load())],
+        keywords=[],
+    )
+    handler = ast.ExceptHandler(
+        type=ast.Name(id=_ERROR, ctx=ast.Load()),
+        name=_CAUGHT,
+        body=[ast.Return(value=unwind)],
+    )
+    func.body = [ast.Try(body=body, handlers=[handler], orelse=[], finalbody=[])]
+
+    code = _compile_function(func, f)
+    if code is not None and sys.version_info >= (3, 11):
+        code = code.replace(co_qualname=f.__code__.co_qualname)
+    return code
+
+
+# functions defined repeatedly (e.g. nested in another function)
+# share a code object, so their source is parsed and compiled only once
+_compiled: WeakKeyDictionary[CodeType, CodeType | None] = WeakKeyDictionary()
+
+
+def rewrite_shortcut(f: C, shortcut: Shortcut) -> C | None:
+    """
+    Returns `f` recompiled with its `.Q` statements expanded
+    according to `shortcut`, or None if `f` cannot be rewritten safely.
+    """
+    if (
+        not isinstance(f, FunctionType)
+        or hasattr(f, "__wrapped__")
+        or f.__code__.co_flags & _SUSPENDABLE
+        or "__class__" in f.__code__.co_freevars
+    ):
+        return None
+
+    try:
+        code = _compiled[f.__code__]
+    except KeyError:
+        code = _compiled[f.__code__] = _compile(f)
+    if code is None:
+        return None
+
+    cells: dict[str, CellType] = dict(zip(f.__code__.co_freevars, f.__closure__ or ()))
+    injected = (shortcut.success, shortcut.failure, shortcut.error, shortcut.unwind)
+    cells.update((name, CellType(value)) for name, value in zip(_INJECTED, injected))
+
+    rewritten = FunctionType(
+        code,
+        f.__globals__,
+        f.__name__,
+        f.__defaults__,
+        tuple(cells[name] for name in code.co_freevars),
+    )
+    rewritten.__kwdefaults__ = f.__kwdefaults__
+    return update_wrapper(rewritten, f)  # type: ignore[return-value]
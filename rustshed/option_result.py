@@ -1,9 +1,10 @@
+# `type(x) is C` checks are intentional: they are fast and narrow the type
+# pylint: disable=too-many-lines,unidiomatic-typecheck
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
 from collections.abc import Callable
-from dataclasses import dataclass
-from typing import Any, Generic, NoReturn, TypeVar, cast, overload
+from dataclasses import FrozenInstanceError
+from typing import Any, ClassVar, Generic, NoReturn, TypeAlias, TypeVar, overload
 
 from .panic import Panic
 
@@ -18,9 +19,9 @@ F = TypeVar("F")
 
 class ResultShortcutError(Exception, Generic[E_co]):
     def __init__(self, error: Err[E_co]) -> None:
-        super().__init__(
-            "The Q operator used without rustshed.result_shortcut decorator!"
-        )
+        # `Exception.__new__` has already stored the arguments,
+        # so the message is assigned directly instead of calling `super().__init__`
+        self.args = ("The Q operator used without rustshed.result_shortcut decorator!",)
         self.error = error
 
     def __class_getitem__(cls, item: Any) -> type[ResultShortcutError[E_co]]:
@@ -33,7 +34,7 @@ class OptionShortcutError(Exception):
     ...
 
 
-class _BaseOption(ABC, Generic[T_co]):
+class _BaseOption(Generic[T_co]):
     """
     Optional values.
 
@@ -58,9 +59,13 @@ class _BaseOption(ABC, Generic[T_co]):
         case Null:
             print("Cannot divide by 0)
     ```
+
+    `Null` is the only instance of `NullType`,
+    so `opt is Null` is equivalent to `opt.is_null()`.
     """
 
-    @abstractmethod
+    __slots__ = ()
+
     def is_some(self) -> bool:
         """
         Returns true if the option is a Some value.
@@ -70,15 +75,15 @@ class _BaseOption(ABC, Generic[T_co]):
 
         If you want to take advantage of a type guard, use `rustshed.is_some` instead.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def is_some_and(self, f: Callable[[T_co], bool]) -> bool:
         """
         Returns true if the option is a Some and the value inside
         of it matches a predicate.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def is_null(self) -> bool:
         """
         Returns true if the option is a Null value.
@@ -88,16 +93,16 @@ class _BaseOption(ABC, Generic[T_co]):
 
         If you want to take advantage of a type guard, use `rustshed.is_null` instead.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def expect(self, msg: str) -> T_co:
         """
         Returns the contained Some value, consuming the self value.
 
         Panics if the value is a Null with a custom panic message provided by msg.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def unwrap(self) -> T_co:
         """
         Returns the contained Some value, consuming the self value.
@@ -108,8 +113,8 @@ class _BaseOption(ABC, Generic[T_co]):
 
         Panics if the self value equals Null.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def unwrap_or(self, default: T_co) -> T_co:  # type: ignore
         """
         Returns the contained Some value or a provided default.
@@ -118,26 +123,26 @@ class _BaseOption(ABC, Generic[T_co]):
         if you are passing the result of a function call,
         it is recommended to use unwrap_or_else, which is lazily evaluated.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def unwrap_or_else(self, f: Callable[[], T_co]) -> T_co:
         """
         Returns the contained Some value or computes it from a closure.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def map(self, f: Callable[[T_co], U]) -> Option[U]:
         """
         Maps an Option<T> to Option<U> by applying a function to a contained value.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def inspect(self, f: Callable[[T_co], Any]) -> Option[T_co]:
         """
         Calls the provided closure with a reference to the contained value (if Some).
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def map_or(self, default: U, f: Callable[[T_co], U]) -> U:
         """
         Returns the provided default result (if Null),
@@ -147,15 +152,15 @@ class _BaseOption(ABC, Generic[T_co]):
         if you are passing the result of a function call,
         it is recommended to use map_or_else, which is lazily evaluated.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def map_or_else(self, default: Callable[[], U], f: Callable[[T_co], U]) -> U:
         """
         Computes a default function result (if null),
         or applies a different function to the contained value (if any).
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def ok_or(self, err: E) -> Result[T_co, E]:
         """
         Transforms the Option<T> into a Result<T, E>,
@@ -165,21 +170,21 @@ class _BaseOption(ABC, Generic[T_co]):
         if you are passing the result of a function call,
         it is recommended to use ok_or_else, which is lazily evaluated.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def ok_or_else(self, err: Callable[[], E]) -> Result[T_co, E]:
         """
         Transforms the Option<T> into a Result<T, E>,
         mapping Some(v) to Ok(v) and Null to Err(err()).
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def and_(self, optb: Option[U]) -> Option[U]:
         """
         Returns Null if the option is Null, otherwise returns optb.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def and_then(self, f: Callable[[T_co], Option[U]]) -> Option[U]:
         """
         Returns Null if the option is Null,
@@ -189,8 +194,8 @@ class _BaseOption(ABC, Generic[T_co]):
 
         Often used to chain fallible operations that may return Null.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def filter(self, predicate: Callable[[T_co], bool]) -> Option[T_co]:
         """
         Returns Null if the option is Null,
@@ -203,8 +208,8 @@ class _BaseOption(ABC, Generic[T_co]):
         You can imagine the Option<T> being an iterator over one or zero elements.
         filter() lets you decide which elements to keep.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def or_(self, optb: Option[T_co]) -> Option[T_co]:
         """
         Returns the option if it contains a value, otherwise returns optb.
@@ -213,21 +218,21 @@ class _BaseOption(ABC, Generic[T_co]):
         if you are passing the result of a function call,
         it is recommended to use or_else, which is lazily evaluated.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def or_else(self, f: Callable[[], Option[T_co]]) -> Option[T_co]:
         """
         Returns the option if it contains a value,
         otherwise calls f and returns the result.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def xor(self, optb: Option[T_co]) -> Option[T_co]:
         """
         Returns Some if exactly one of self, optb is Some, otherwise returns Null.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def zip(self, other: Option[U]) -> Option[tuple[T_co, U]]:
         """
         Zips self with another Option.
@@ -236,8 +241,8 @@ class _BaseOption(ABC, Generic[T_co]):
         this method returns Some((s, o)).
         Otherwise, Null is returned.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def zip_with(self, other: Option[U], f: Callable[[T_co, U], R]) -> Option[R]:
         """
         Zips self and another Option with function f.
@@ -246,8 +251,8 @@ class _BaseOption(ABC, Generic[T_co]):
         this method returns Some(f(s, o)).
         Otherwise, Null is returned.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def unzip(self: _BaseOption[tuple[U, R]]) -> tuple[Option[U], Option[R]]:
         """
         Unzips an option containing a tuple of two options.
@@ -255,8 +260,8 @@ class _BaseOption(ABC, Generic[T_co]):
         If self is Some((a, b)) this method returns (Some(a), Some(b)).
         Otherwise, (Null, Null) is returned.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def transpose(self: _BaseOption[_BaseResult[T, E]]) -> Result[Option[T], E]:
         """
         Transposes an Option of a Result into a Result of an Option.
@@ -264,25 +269,54 @@ class _BaseOption(ABC, Generic[T_co]):
         Null will be mapped to Ok(Null).
         Some(Ok(T)) and Some(Err(E)) will be mapped to Ok(Some(T)) and Err(E).
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def flatten(self: _BaseOption[_BaseOption[U]]) -> Option[U]:
         """
         Converts from Option<Option<T>> to Option<T>.
         """
+        raise NotImplementedError
 
     @property
-    @abstractmethod
     def Q(self) -> T_co:
         """
         TODO: docs
         """
+        raise NotImplementedError
 
 
-@dataclass(frozen=True, slots=True)
 class Some(_BaseOption[T_co]):
+    __slots__ = ("value",)
+    __match_args__ = ("value",)
+
     value: T_co
 
+    def __init__(self, value: T_co) -> None:
+        _set_some_value(self, value)
+
+    def __setattr__(self, name: str, value: Any) -> NoReturn:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> NoReturn:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __repr__(self) -> str:
+        return f"Some(value={self.value!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        value = other.value
+        return self.value is value or self.value == value
+
+    def __hash__(self) -> int:
+        # a per-class mask tells Some(x), Ok(x) and Err(x) apart
+        # without building a tuple to hash
+        return hash(self.value) ^ 0x5A5A5A5A
+
+    def __reduce__(self) -> tuple[type[Some[T_co]], tuple[T_co]]:
+        return (self.__class__, (self.value,))
+
     def is_some(self) -> bool:
         return True
 
@@ -339,7 +373,7 @@ class Some(_BaseOption[T_co]):
         return self
 
     def xor(self, optb: Option[T_co]) -> Option[T_co]:
-        return self if optb.is_null() else Null
+        return self if optb is Null else Null
 
     @overload
     def zip(self, other: NullType) -> NullType:
@@ -354,11 +388,9 @@ class Some(_BaseOption[T_co]):
         ...  # pragma: no cover
 
     def zip(self, other: Option[U]) -> Option[tuple[T_co, U]]:
-        match other:
-            case Some(value):
-                return Some((self.value, value))
-            case _:
-                return Null
+        if type(other) is Some:
+            return Some((self.value, other.value))
+        return Null
 
     @overload
     def zip_with(self, other: NullType, f: Callable[[T_co, Any], Any]) -> NullType:
@@ -373,16 +405,14 @@ class Some(_BaseOption[T_co]):
         ...  # pragma: no cover
 
     def zip_with(self, other: Option[U], f: Callable[[T_co, U], R]) -> Option[R]:
-        match other:
-            case Some(value):
-                return Some(f(self.value, value))
-            case _:
-                return Null
+        if type(other) is Some:
+            return Some(f(self.value, other.value))
+        return Null
 
-    def unzip(self: _BaseOption[tuple[U, R]]) -> tuple[Option[U], Option[R]]:
-        match self:
-            case Some((left, right)):
-                return cast(tuple[Option[U], Option[R]], (Some(left), Some(right)))
+    def unzip(self: Some[tuple[U, R]]) -> tuple[Option[U], Option[R]]:
+        match self.value:
+            case (left, right):
+                return Some(left), Some(right)
             case _:
                 return Null, Null
 
@@ -395,18 +425,17 @@ class Some(_BaseOption[T_co]):
         ...  # pragma: no cover
 
     @overload
-    def transpose(self: Option[Result[T, E]]) -> Result[Option[T], E]:
+    def transpose(self: Some[Result[T, E]]) -> Result[Option[T], E]:
         ...  # pragma: no cover
 
-    def transpose(self: Option[Result[T, E]]) -> Result[Option[T], E]:
-        match self:
-            case Some(Ok(value)):
-                return Ok(Some(value))
-            case Some(Err(error)):
-                return Err(error)
-            case _:  # pragma: no cover
-                # it will never happen
-                raise RuntimeError
+    def transpose(self: Some[Result[T, E]]) -> Result[Option[T], E]:
+        inner = self.value
+        if type(inner) is Ok:
+            return Ok(Some(inner.value))
+        if type(inner) is Err:
+            return Err(inner.error)
+        # it will never happen
+        raise RuntimeError  # pragma: no cover
 
     @overload
     def flatten(self: Some[NullType]) -> NullType:
@@ -421,22 +450,45 @@ class Some(_BaseOption[T_co]):
         ...  # pragma: no cover
 
     def flatten(self: Some[NullType | Some[U]]) -> NullType | Some[U]:
-        match self:
-            case Some(NullType()):
-                return Null
-            case Some(Some(val)):
-                return Some(val)
-            case _:  # pragma: no cover
-                # it will never happen
-                raise RuntimeError
+        inner = self.value
+        if inner is Null:
+            return Null
+        if type(inner) is Some:
+            return Some(inner.value)
+        # it will never happen
+        raise RuntimeError  # pragma: no cover
 
     @property
     def Q(self) -> T_co:
         return self.value
 
 
-@dataclass(frozen=True, slots=True)
 class NullType(_BaseOption[Any]):
+    __slots__ = ()
+
+    _instance: ClassVar[NullType | None] = None
+
+    def __new__(cls) -> NullType:
+        # `Null` is the only instance, so options can be checked with `is Null`
+        # and the default identity based equality and hashing apply
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __reduce__(self) -> str:
+        # pickle protocols 0 and 1 (and thus copy) would otherwise bypass
+        # `__new__`, so they are told to look up the module-level `Null`
+        return "Null"
+
+    def __setattr__(self, name: str, value: Any) -> NoReturn:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> NoReturn:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __repr__(self) -> str:
+        return "NullType()"
+
     def __str__(self) -> str:
         return "Null"
 
@@ -507,7 +559,7 @@ class NullType(_BaseOption[Any]):
         ...  # pragma: no cover
 
     def xor(self, optb: Option[T_co]) -> Option[T_co]:
-        return self if optb.is_null() else optb
+        return self if optb is Null else optb
 
     def zip(self, other: Option[U]) -> NullType:
         return Null
@@ -529,13 +581,18 @@ class NullType(_BaseOption[Any]):
         raise OptionShortcutError
 
 
-Option = Some[T_co] | NullType
+# The slot descriptor's setter bypasses the frozen `__setattr__`
+# without going through `object.__setattr__` on every construction.
+_set_some_value = vars(Some)["value"].__set__
+
+Option: TypeAlias = Some[T_co] | NullType
 
 Null = NullType()
 
 
-class _BaseResult(ABC, Generic[T_co, E_co]):
-    @abstractmethod
+class _BaseResult(Generic[T_co, E_co]):
+    __slots__ = ()
+
     def is_ok(self) -> bool:
         """
         Returns true if the result is Ok.
@@ -545,15 +602,15 @@ class _BaseResult(ABC, Generic[T_co, E_co]):
 
         If you want to take advantage of a type guard, use `rustshed.is_ok` instead.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def is_ok_and(self, f: Callable[[T_co], bool]) -> bool:
         """
         Returns true if the result is Ok
         and the value inside of it matches a predicate.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def is_err(self) -> bool:
         """
         Returns true if the result is Err.
@@ -563,15 +620,15 @@ class _BaseResult(ABC, Generic[T_co, E_co]):
 
         If you want to take advantage of a type guard, use `rustshed.is_err` instead.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def is_err_and(self, f: Callable[[E_co], bool]) -> bool:
         """
         Returns true if the result is Err
         and the value inside of it matches a predicate.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def ok(self) -> Option[T_co]:
         """
         Converts from Result<T, E> to Option<T>.
@@ -579,8 +636,8 @@ class _BaseResult(ABC, Generic[T_co, E_co]):
         Converts self into an Option<T>, consuming self,
         and discarding the error, if any.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def err(self) -> Option[E_co]:
         """
         Converts from Result<T, E> to Option<E>.
@@ -588,8 +645,8 @@ class _BaseResult(ABC, Generic[T_co, E_co]):
         Converts self into an Option<E>, consuming self,
         and discarding the success value, if any.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def map(self, fn: Callable[[T_co], U]) -> Result[U, E_co]:
         """
         Maps a Result<T, E> to Result<U, E>
@@ -598,8 +655,8 @@ class _BaseResult(ABC, Generic[T_co, E_co]):
 
         This function can be used to compose the results of two functions.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def map_or(self, default: U, fn: Callable[[T_co], U]) -> U:
         """
         Returns the provided default (if Err),
@@ -609,8 +666,8 @@ class _BaseResult(ABC, Generic[T_co, E_co]):
         if you are passing the result of a function call,
         it is recommended to use map_or_else, which is lazily evaluated.ń
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def map_or_else(self, default: Callable[[E_co], U], f: Callable[[T_co], U]) -> U:
         """
         Maps a Result<T, E> to U by applying fallback function default
@@ -619,8 +676,8 @@ class _BaseResult(ABC, Generic[T_co, E_co]):
         This function can be used to unpack a successful result
         while handling an error.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def map_err(self, op: Callable[[E_co], F]) -> Result[T_co, F]:
         """
         Maps a Result<T, E> to Result<T, F> by applying a function
@@ -629,20 +686,20 @@ class _BaseResult(ABC, Generic[T_co, E_co]):
         This function can be used to pass through a successful result
         while handling an error.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def inspect(self, f: Callable[[T_co], Any]) -> Result[T_co, E_co]:
         """
         Calls the provided closure with a reference to the contained value (if Ok).
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def inspect_err(self, f: Callable[[E_co], Any]) -> Result[T_co, E_co]:
         """
         Calls the provided closure with a reference to the contained error (if Err).
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def expect(self, msg: str) -> T_co:
         """
         Returns the contained Ok value, consuming the self value.
@@ -650,8 +707,8 @@ class _BaseResult(ABC, Generic[T_co, E_co]):
         Panics if the value is an Err, with a panic message
         including the passed message, and the content of the Err.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def unwrap(self) -> T_co:
         """
         Returns the contained Ok value, consuming the self value.
@@ -663,8 +720,8 @@ class _BaseResult(ABC, Generic[T_co, E_co]):
         Panics if the value is an Err,
         with a panic message provided by the Err's value.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def expect_err(self, msg: str) -> E_co:
         """
         Returns the contained Err value, consuming the self value.
@@ -672,8 +729,8 @@ class _BaseResult(ABC, Generic[T_co, E_co]):
         Panics if the value is an Ok, with a panic message
         including the passed message, and the content of the Ok.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def unwrap_err(self) -> E_co:
         """
         Returns the contained Err value, consuming the self value.
@@ -681,14 +738,14 @@ class _BaseResult(ABC, Generic[T_co, E_co]):
         Panics if the value is an Ok, with a custom panic message
         provided by the Ok's value.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def and_(self, res: Result[U, E_co]) -> Result[U, E_co]:
         """
         Returns res if the result is Ok, otherwise returns the Err value of self.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def and_then(self, op: Callable[[T_co], Result[U, E_co]]) -> Result[U, E_co]:
         """
         Calls op if the result is Ok, otherwise returns the Err value of self.
@@ -696,8 +753,8 @@ class _BaseResult(ABC, Generic[T_co, E_co]):
         This function can be used for control flow based on Result values.
         Often used to chain fallible operations that may return Err.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def or_(self, res: Result[T_co, F]) -> Result[T_co, F]:
         """
         Returns res if the result is Err, otherwise returns the Ok value of self.
@@ -706,16 +763,16 @@ class _BaseResult(ABC, Generic[T_co, E_co]):
         if you are passing the result of a function call,
         it is recommended to use or_else, which is lazily evaluated.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def or_else(self, op: Callable[[E_co], Result[T_co, F]]) -> Result[T_co, F]:
         """
         Calls op if the result is Err, otherwise returns the Ok value of self.
 
         This function can be used for control flow based on result values.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def unwrap_or(self, default: T_co) -> T_co:  # type: ignore
         """
         Returns the contained Ok value or a provided default.
@@ -724,26 +781,26 @@ class _BaseResult(ABC, Generic[T_co, E_co]):
         if you are passing the result of a function call,
         it is recommended to use unwrap_or_else, which is lazily evaluated.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def unwrap_or_else(self, op: Callable[[E_co], T_co]) -> T_co:
         """
         Returns the contained Ok value or computes it from a closure.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def contains(self, x: object) -> bool:
         """
         Returns true if the result is an Ok value containing the given value.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def contains_err(self, f: object) -> bool:
         """
         Returns true if the result is an Err value containing the given value.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def transpose(self: _BaseResult[_BaseOption[T], E]) -> Option[Result[T, E]]:
         """
         Transposes a Result of an Option into an Option of a Result.
@@ -751,17 +808,43 @@ class _BaseResult(ABC, Generic[T_co, E_co]):
         Ok(Null) will be mapped to Null.
         Ok(Some(T)) and Err(E) will be mapped to Some(Ok(T)) and Some(Err(E)).
         """
+        raise NotImplementedError
 
     @property
-    @abstractmethod
     def Q(self) -> T_co:
-        ...  # pragma: no cover
+        raise NotImplementedError
 
 
-@dataclass(frozen=True, slots=True)
 class Ok(_BaseResult[T_co, Any]):
+    __slots__ = ("value",)
+    __match_args__ = ("value",)
+
     value: T_co
 
+    def __init__(self, value: T_co) -> None:
+        _set_ok_value(self, value)
+
+    def __setattr__(self, name: str, value: Any) -> NoReturn:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> NoReturn:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __repr__(self) -> str:
+        return f"Ok(value={self.value!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        value = other.value
+        return self.value is value or self.value == value
+
+    def __hash__(self) -> int:
+        return hash(self.value) ^ 0xA5A5A5A5
+
+    def __reduce__(self) -> tuple[type[Ok[T_co]], tuple[T_co]]:
+        return (self.__class__, (self.value,))
+
     def is_ok(self) -> bool:
         return True
 
@@ -848,24 +931,49 @@ class Ok(_BaseResult[T_co, Any]):
         ...  # pragma: no cover
 
     def transpose(self: Ok[Option[T]]) -> Option[Ok[T]]:
-        match self:
-            case Ok(Some(value)):
-                return Some(Ok(value))
-            case Ok(NullType()):
-                return Null
-            case _:  # pragma: no cover
-                # it will never happen
-                raise RuntimeError
+        inner = self.value
+        if type(inner) is Some:
+            return Some(Ok(inner.value))
+        if inner is Null:
+            return Null
+        # it will never happen
+        raise RuntimeError  # pragma: no cover
 
     @property
     def Q(self) -> T_co:
         return self.value
 
 
-@dataclass(frozen=True, slots=True)
 class Err(_BaseResult[Any, E_co]):
+    __slots__ = ("error",)
+    __match_args__ = ("error",)
+
     error: E_co
 
+    def __init__(self, error: E_co) -> None:
+        _set_err_error(self, error)
+
+    def __setattr__(self, name: str, value: Any) -> NoReturn:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> NoReturn:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __repr__(self) -> str:
+        return f"Err(error={self.error!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        error = other.error
+        return self.error is error or self.error == error
+
+    def __hash__(self) -> int:
+        return hash(self.error) ^ 0x3C3C3C3C
+
+    def __reduce__(self) -> tuple[type[Err[E_co]], tuple[E_co]]:
+        return (self.__class__, (self.error,))
+
     def is_ok(self) -> bool:
         return False
 
@@ -947,5 +1055,8 @@ class Err(_BaseResult[Any, E_co]):
         raise ResultShortcutError(self)
 
 
-Result = Ok[T_co] | Err[E_co]
-IOResult = Result[T_co, IOError]
+_set_ok_value = vars(Ok)["value"].__set__
+_set_err_error = vars(Err)["error"].__set__
+
+Result: TypeAlias = Ok[T_co] | Err[E_co]
+IOResult: TypeAlias = Result[T_co, IOError]
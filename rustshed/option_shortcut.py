@@ -2,6 +2,7 @@ from collections.abc import Callable
 from functools import wraps
 from typing import ParamSpec, TypeVar
 
+from rustshed._shortcut import OPTION, rewrite_shortcut
 from rustshed.option_result import Null, Option, OptionShortcutError
 
 T = TypeVar("T")
@@ -9,6 +10,16 @@ P = ParamSpec("P")
 
 
 def option_shortcut(f: Callable[P, Option[T]]) -> Callable[P, Option[T]]:
+    """
+    Makes the Q operator return early from `f` with Null if it was used on Null.
+
+    Where possible, `f` is recompiled so that `x = expr.Q`, `x: T = expr.Q`,
+    `return expr.Q` and bare `expr.Q` statements return Null directly
+    instead of raising and catching an exception. Any other use of `.Q`,
+    and functions whose source is unavailable (e.g. lambdas or REPL
+    definitions), fall back to catching the exception raised by `NullType.Q`.
+    """
+
     @wraps(f)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> Option[T]:
         try:
@@ -16,4 +27,4 @@ def option_shortcut(f: Callable[P, Option[T]]) -> Callable[P, Option[T]]:
         except OptionShortcutError:
             return Null
 
-    return wrapper
+    return rewrite_shortcut(f, OPTION) or wrapper
@@ -2,6 +2,7 @@ from collections.abc import Callable
 from functools import wraps
 from typing import ParamSpec, TypeVar
 
+from rustshed._shortcut import RESULT, rewrite_shortcut
 from rustshed.option_result import Result, ResultShortcutError
 
 T = TypeVar("T")
@@ -10,6 +11,16 @@ P = ParamSpec("P")
 
 
 def result_shortcut(f: Callable[P, Result[T, E]]) -> Callable[P, Result[T, E]]:
+    """
+    Makes the Q operator return early from `f` with the Err it was used on.
+
+    Where possible, `f` is recompiled so that `x = expr.Q`, `x: T = expr.Q`,
+    `return expr.Q` and bare `expr.Q` statements return the error directly
+    instead of raising and catching an exception. Any other use of `.Q`,
+    and functions whose source is unavailable (e.g. lambdas or REPL
+    definitions), fall back to catching the exception raised by `Err.Q`.
+    """
+
     @wraps(f)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> Result[T, E]:
         try:
@@ -17,4 +28,4 @@ def result_shortcut(f: Callable[P, Result[T, E]]) -> Callable[P, Result[T, E]]:
         except ResultShortcutError[E] as err:
             return err.error
 
-    return wrapper
+    return rewrite_shortcut(f, RESULT) or wrapper
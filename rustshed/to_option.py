@@ -1,17 +1,28 @@
+from __future__ import annotations
+
 from collections.abc import Callable
 from functools import wraps
 from typing import ParamSpec, TypeVar
 
+from rustshed._shared import shared_wrapper
 from rustshed.option_result import Null, Option, Some
 
 T = TypeVar("T")
 P = ParamSpec("P")
 
+_Exceptions = type[Exception] | tuple[type[Exception], ...]
+
+_some = shared_wrapper(Some)
 
-def to_option(f: Callable[P, T]) -> Callable[P, Option[T]]:
+
+class _to_option_type:
     """
     Converts a callable that returns `T` to a callable that returns `Option[T]`
 
+    By default any `Exception` raised by the callable results in `Null`.
+    Subscripting with exception types, e.g. `to_option[IndexError]`,
+    converts only those to `Null` and lets any other exception propagate.
+
     ### Example
     ```
     from rustshed import to_option
@@ -23,13 +34,35 @@ def to_option(f: Callable[P, T]) -> Callable[P, Option[T]]:
 
     # when run with mypy or pyright
     reveal_type(parse("1"))  # Option[int]
+
+
+    @to_option[IndexError]
+    def first(lst: list[int]) -> int:
+        return lst[0]
+
+    first([])  # Null
+    first(None)  # raises TypeError
+    ```
     """
 
-    @wraps(f)
-    def wrapper(*args: P.args, **kwargs: P.kwargs) -> Option[T]:
-        try:
-            return Some(f(*args, **kwargs))
-        except Exception:  # pylint: disable=broad-except
-            return Null
+    def __init__(self, exceptions: _Exceptions = Exception) -> None:
+        self._exceptions = exceptions
+
+    def __call__(self, f: Callable[P, T]) -> Callable[P, Option[T]]:
+        exceptions = self._exceptions
+
+        @wraps(f)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> Option[T]:
+            try:
+                value = f(*args, **kwargs)
+            except exceptions:  # pylint: disable=broad-except
+                return Null
+            return _some(value)
+
+        return wrapper
+
+    def __getitem__(self, exceptions: _Exceptions) -> _to_option_type:
+        return _to_option_type(exceptions)
+
 
-    return wrapper
+to_option = _to_option_type()
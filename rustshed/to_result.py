@@ -2,18 +2,23 @@ from collections.abc import Callable
 from functools import wraps
 from typing import ParamSpec, TypeVar
 
+from rustshed._shared import shared_wrapper
 from rustshed.option_result import Err, Ok, Result
 
 T = TypeVar("T")
 E = TypeVar("E", bound=Exception)
 P = ParamSpec("P")
 
+_ok = shared_wrapper(Ok)
+
 
 class _to_result_type:
     """
     Converts a callable that returns `T` to a callable that returns `Result[T, E]`
     where `E` a subclass of `Exception`.
 
+    Only exceptions of type `E` are converted to `Err`, any other exception
+    propagates. Without a type parameter any `Exception` is converted.
 
     ### Example
     ```
@@ -32,24 +37,30 @@ class _to_result_type:
     reveal_type(get_from_lst([1, 2, 3], 3))  # Result[int, IndexError]
     """
 
+    def __init__(self, exception: type[Exception] = Exception) -> None:
+        self._exception = exception
+
     def __call__(self, f: Callable[P, T]) -> Callable[P, Result[T, Exception]]:
+        exception = self._exception
+
         @wraps(f)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> Result[T, Exception]:
             try:
-                return Ok(f(*args, **kwargs))
-            except Exception as err:  # pylint: disable=broad-except
+                value = f(*args, **kwargs)
+            except exception as err:  # pylint: disable=broad-except
                 return Err(err)
+            return _ok(value)
 
         return wrapper
 
     def __getitem__(
-        self, _: type[E]
+        self, exception: type[E]
     ) -> Callable[[Callable[P, T]], Callable[P, Result[T, E]]]:
         """
         This effectively enables generic type application
         for objects of this callable class
         """
-        return self  # type: ignore
+        return _to_result_type(exception)  # type: ignore
 
 
 to_result = _to_result_type()
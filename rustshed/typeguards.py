@@ -1,22 +1,22 @@
 from typing import Any, TypeGuard, TypeVar
 
-from rustshed.option_result import Err, NullType, Ok, Option, Result, Some
+from rustshed.option_result import Err, Null, NullType, Ok, Option, Result, Some
 
 T = TypeVar("T")
 E = TypeVar("E")
 
 
 def is_some(opt: Option[T]) -> TypeGuard[Some[T]]:
-    return opt.is_some()
+    return opt is not Null
 
 
 def is_null(opt: Option[Any]) -> TypeGuard[NullType]:
-    return opt.is_null()
+    return opt is Null
 
 
 def is_ok(res: Result[T, Any]) -> TypeGuard[Ok[T]]:
-    return res.is_ok()
+    return isinstance(res, Ok)
 
 
 def is_err(res: Result[Any, E]) -> TypeGuard[Err[E]]:
-    return res.is_err()
+    return isinstance(res, Err)
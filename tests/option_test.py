@@ -1,7 +1,9 @@
 from collections.abc import Callable
-from dataclasses import dataclass
-from functools import partial
+from copy import copy, deepcopy
+from dataclasses import FrozenInstanceError, dataclass
+from functools import cache, partial
 from math import sqrt
+from pickle import HIGHEST_PROTOCOL, dumps, loads
 from typing import SupportsIndex, TypeVar
 
 import pytest
@@ -9,6 +11,7 @@ import pytest
 from rustshed import (
     Err,
     Null,
+    NullType,
     Ok,
     Option,
     Panic,
@@ -17,6 +20,26 @@ from rustshed import (
     option_shortcut,
     to_option,
 )
+from rustshed.option_result import OptionShortcutError
+
+T = TypeVar("T")
+
+
+def greater_than_one(x: int) -> bool:
+    return x > 1
+
+
+def is_even(n: int) -> bool:
+    return n % 2 == 0
+
+
+checked_sqrt = to_option(sqrt)
+
+
+# pure and returning immutable values, so safe to share between tests
+@cache
+def sqrt_then_to_string(x: float) -> Option[str]:
+    return checked_sqrt(x).map(str)
 
 
 def test_is_some() -> None:
@@ -28,8 +51,6 @@ def test_is_some() -> None:
 
 
 def test_is_some_and() -> None:
-    greater_than_one: Callable[[int], bool] = lambda x: x > 1
-
     x: Option[int] = Some(2)
     assert x.is_some_and(greater_than_one) is True
 
@@ -53,11 +74,9 @@ def test_expect() -> None:
     assert x.expect("fruits are healthy") == "value"
 
     x = Null
-    with pytest.raises(Panic) as panic:
+    with pytest.raises(Panic, match=r"^fruits are healthy$"):
         x.expect("fruits are healthy")
 
-    assert str(panic.value) == "fruits are healthy"
-
 
 def test_unwrap() -> None:
     x: Option[str] = Some("air")
@@ -86,8 +105,6 @@ def test_map() -> None:
 
 
 def test_inspect(capsys: pytest.CaptureFixture[str]) -> None:
-    T = TypeVar("T")
-
     @to_option
     def get(xs: list[T], index: SupportsIndex) -> T:
         return xs[index]
@@ -103,6 +120,29 @@ def test_inspect(capsys: pytest.CaptureFixture[str]) -> None:
     assert capsys.readouterr().out == "got 4\n"
 
 
+def test_to_option_with_exception_types() -> None:
+    @to_option[IndexError, KeyError]
+    def get(xs: list[int], index: int) -> int:
+        return xs[index]
+
+    assert get([1, 2], 1) == Some(2)
+    assert get([1, 2], 2) is Null
+
+    with pytest.raises(TypeError):
+        get([1, 2], "1")  # type: ignore
+
+
+def test_to_option_shares_constant_results() -> None:
+    @to_option
+    def identity(x: object) -> object:
+        return x
+
+    for value in (None, True, False):
+        assert identity(value) == Some(value)
+        assert identity(value) is identity(value)
+    assert identity(1) == Some(1)
+
+
 def test_map_or() -> None:
     x: Option[str] = Some("foo")
     assert x.map_or(42, len) == 3
@@ -137,75 +177,63 @@ def test_ok_or_else() -> None:
     assert x.ok_or_else(lambda: 0) == Err(0)
 
 
-def test_and() -> None:
-    x: Option[int] = Some(2)
-    y: Option[str] = Null
-    assert x.and_(y) == Null
-
-    x = Null
-    y = Some("foo")
-    assert x.and_(y) == Null
+@pytest.mark.parametrize(
+    "x, y, expected",
+    (
+        (Some(2), Null, Null),
+        (Null, Some("foo"), Null),
+        (Some(2), Some("foo"), Some("foo")),
+        (Null, Null, Null),
+    ),
+)
+def test_and(x: Option[int], y: Option[str], expected: Option[str]) -> None:
+    assert x.and_(y) == expected
 
-    x = Some(2)
-    y = Some("foo")
-    assert x.and_(y) == Some("foo")
 
-    x = Null
-    y = Null
-    assert x.and_(y) == Null
+class SafeList(list[T]):
+    __slots__ = ()
 
+    def get(self, index: SupportsIndex) -> Option[T]:
+        i = index.__index__()
+        if -len(self) <= i < len(self):
+            return Some(self[i])
+        return Null
 
-def test_and_then() -> None:
-    T = TypeVar("T")
 
-    class SafeList(list[T]):
-        def get(self, index: SupportsIndex) -> Option[T]:
-            try:
-                return Some(self[index])
-            except IndexError:
-                return Null
+@pytest.fixture(name="arr_2d", scope="module")
+def fixture_arr_2d() -> SafeList[SafeList[str]]:
+    return SafeList([SafeList(["A0", "A1"]), SafeList(["B0", "B1"])])
 
-    def sqrt_then_to_string(x: float) -> Option[str]:
-        return to_option(sqrt)(x).map(str)
 
+def test_and_then(arr_2d: SafeList[SafeList[str]]) -> None:
     assert Some(16).and_then(sqrt_then_to_string) == Some("4.0")
-    assert Some(-1).and_then(sqrt_then_to_string) == Null  # sqrt of -1!
-    assert Null.and_then(sqrt_then_to_string) == Null
-
-    arr_2d = SafeList([SafeList(["A0", "A1"]), SafeList(["B0", "B1"])])
+    assert Some(-1).and_then(sqrt_then_to_string) is Null  # sqrt of -1!
+    assert Null.and_then(sqrt_then_to_string) is Null
 
     item_0_1 = arr_2d.get(0).and_then(partial(SafeList[str].get, index=1))
     assert item_0_1 == Some("A1")
 
     item_2_0 = arr_2d.get(2).and_then(partial(SafeList[str].get, index=0))
-    assert item_2_0 == Null
+    assert item_2_0 is Null
 
 
 def test_filter() -> None:
-    def is_even(n: int) -> bool:
-        return n % 2 == 0
-
-    assert Null.filter(is_even) == Null
-    assert Some(3).filter(is_even) == Null
+    assert Null.filter(is_even) is Null
+    assert Some(3).filter(is_even) is Null
     assert Some(4).filter(is_even) == Some(4)
 
 
-def test_or() -> None:
-    x: Option[int] = Some(2)
-    y: Option[int] = Null
-    assert x.or_(y) == Some(2)
-
-    x = Null
-    y = Some(100)
-    assert x.or_(y) == Some(100)
-
-    x = Some(2)
-    y = Some(100)
-    assert x.or_(y) == Some(2)  # type: ignore
-
-    x = Null
-    y = Null
-    assert x.or_(y) == Null
+@pytest.mark.parametrize(
+    "x, y, expected",
+    (
+        (Some(2), Null, Some(2)),
+        (Null, Some(100), Some(100)),
+        (Some(2), Some(100), Some(2)),
+        (Null, Null, Null),
+    ),
+)
+def test_or(x: Option[int], y: Option[int], expected: Option[int]) -> None:
+    assert x.or_(y) == expected
 
 
 def test_or_else() -> None:
@@ -217,25 +245,20 @@ def test_or_else() -> None:
 
     assert Some("barbarians").or_else(vikings) == Some("barbarians")
     assert Null.or_else(vikings) == Some("vikings")
-    assert Null.or_else(nobody) == Null
-
-
-def test_xor() -> None:
-    x: Option[int] = Some(2)
-    y: Option[int] = Null
-    assert x.xor(y) == Some(2)
-
-    x = Null
-    y = Some(2)
-    assert x.xor(y) == Some(2)
+    assert Null.or_else(nobody) is Null
 
-    x = Some(2)
-    y = Some(2)
-    assert x.xor(y) == Null
 
-    x = Null
-    y = Null
-    assert x.xor(y) == Null
+@pytest.mark.parametrize(
+    "x, y, expected",
+    (
+        (Some(2), Null, Some(2)),
+        (Null, Some(2), Some(2)),
+        (Some(2), Some(2), Null),
+        (Null, Null, Null),
+    ),
+)
+def test_xor(x: Option[int], y: Option[int], expected: Option[int]) -> None:
+    assert x.xor(y) == expected
 
 
 def test_zip() -> None:
@@ -244,12 +267,12 @@ def test_zip() -> None:
     z = Null
 
     assert x.zip(y) == Some((1, "hi"))
-    assert x.zip(z) == Null
-    assert z.zip(z) == Null
+    assert x.zip(z) is Null
+    assert z.zip(z) is Null
 
 
 def test_zip_with() -> None:
-    @dataclass
+    @dataclass(frozen=True, slots=True)
     class Point:
         x: float
         y: float
@@ -258,9 +281,9 @@ def test_zip_with() -> None:
     y = Some(42.5)
 
     assert x.zip_with(y, Point) == Some(Point(17.5, 42.5))
-    assert x.zip_with(Null, Point) == Null
-    assert Null.zip_with(x, Point) == Null
-    assert Null.zip_with(Null, Point) == Null
+    assert x.zip_with(Null, Point) is Null
+    assert Null.zip_with(x, Point) is Null
+    assert Null.zip_with(Null, Point) is Null
 
 
 def test_unzip() -> None:
@@ -270,6 +293,9 @@ def test_unzip() -> None:
     assert x.unzip() == (Some(1), Some("hi"))
     assert y.unzip() == (Null, Null)
     assert Some(1).unzip() == (Null, Null)  # type: ignore
+    assert Some([1, "hi"]).unzip() == (Some(1), Some("hi"))  # type: ignore
+    assert Some("hi").unzip() == (Null, Null)  # type: ignore
+    assert Some((1, 2, 3)).unzip() == (Null, Null)  # type: ignore
 
 
 def test_transpose() -> None:
@@ -291,10 +317,10 @@ def test_flatten() -> None:
     assert x.flatten() == Some(6)
 
     x = Some(Null)
-    assert x.flatten() == Null
+    assert x.flatten() is Null
 
     x = Null
-    assert x.flatten() == Null
+    assert x.flatten() is Null
 
     y = Some(Some(2))
     assert y.flatten() == Some(2)
@@ -305,18 +331,149 @@ def test_flatten() -> None:
 
 
 def test_option_shortcut() -> None:
-    def sqrt_then_to_string(x: float) -> Option[str]:
-        return to_option(sqrt)(x).map(str)
+    reached: list[str] = []
 
     @option_shortcut
     def operation(x: float) -> Option[str]:
         sq = sqrt_then_to_string(x).Q
-        print(sq)
+        reached.append(sq)
         return Some(sq)
 
     assert operation(16) == Some("4.0")
-    assert operation(-2) == Null
+    assert operation(-2) is Null
+    # the rest of the body is skipped after an early return
+    assert reached == ["4.0"]
+
+
+def test_option_shortcut_returns_early_without_raising(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[int] = []
+
+    def record(x: int) -> Option[int]:
+        calls.append(x)
+        return Some(x) if x >= 0 else Null
+
+    @option_shortcut
+    def operation(x: int) -> Option[int]:
+        first = record(x).Q
+        second = record(first - 10).Q
+        return Some(second)
+
+    def fail(_: NullType) -> None:
+        pytest.fail("NullType.Q should not be evaluated")
+
+    monkeypatch.setattr(NullType, "Q", property(fail))
+
+    assert operation(12) == Some(2)
+    assert operation(5) is Null
+    assert operation(-1) is Null
+    assert calls == [12, 2, 5, -5, -1]
+
+    lambda_operation: Callable[[], Option[int]] = option_shortcut(lambda: Some(Null.Q))
+    monkeypatch.undo()
+    assert lambda_operation() is Null
+
+
+def test_option_shortcut_rewrites_q_in_nested_blocks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def step(x: int) -> Option[int]:
+        return Some(x) if x >= 0 else Null
+
+    @option_shortcut
+    def operation(xs: list[int]) -> Option[int]:
+        total = 0
+        while xs:
+            x = xs.pop()
+            if x == 0:
+                break
+            if x > 9:
+                digit = step(19 - x).Q
+            elif x > 0:
+                digit = step(x).Q
+            else:
+                digit = step(x).Q
+            total += digit
+        else:
+            step(total - 1).Q  # pylint: disable=expression-not-assigned
+        for _ in range(2):
+            total = step(total - 5).Q
+        return Some(total)
+
+    def fail(_: NullType) -> None:
+        pytest.fail("NullType.Q should not be evaluated")
+
+    monkeypatch.setattr(NullType, "Q", property(fail))
+
+    assert operation([5, 9]) == Some(4)
+    assert operation([12, 9]) == Some(6)
+    assert operation([0, 5, 9]) == Some(4)
+    assert operation([25]) is Null
+    assert operation([-1]) is Null
+    assert operation([]) is Null
+    assert operation([0, 9]) is Null
 
 
 def test_null_to_str() -> None:
     assert str(Null) == "Null"
+
+
+def test_option_repr() -> None:
+    assert repr(Some(1)) == "Some(value=1)"
+    assert repr(Some("a")) == "Some(value='a')"
+    assert repr(Null) == "NullType()"
+
+
+def test_q_without_option_shortcut() -> None:
+    assert Some(1).Q == 1
+    with pytest.raises(OptionShortcutError):
+        Null.Q  # pylint: disable=pointless-statement
+
+
+def test_options_pickle_round_trip() -> None:
+    assert loads(dumps(Some(1))) == Some(1)
+    assert loads(dumps(Some(Null))) == Some(Null)
+    assert loads(dumps(Null)) is Null
+
+
+def test_null_is_singleton() -> None:
+    assert NullType() is Null
+    assert copy(Null) is Null
+    assert deepcopy(Null) is Null
+    for protocol in range(HIGHEST_PROTOCOL + 1):
+        assert loads(dumps(Null, protocol)) is Null
+    assert Some(Null).flatten() is Null
+
+
+def test_null_equality_is_identity() -> None:
+    # NullType relies on object's __eq__ and __hash__,
+    # so any copy of Null has to be Null itself
+    for protocol in range(HIGHEST_PROTOCOL + 1):
+        unpickled = loads(dumps(Null, protocol))
+        assert unpickled == Null
+        assert hash(unpickled) == hash(Null)
+    assert deepcopy(Some(Null)) == Some(Null)
+    assert Null != Some(None)
+
+
+def test_options_have_no_instance_dict() -> None:
+    assert not hasattr(Some(1), "__dict__")
+    assert not hasattr(Null, "__dict__")
+
+
+def test_options_are_immutable_and_hashable() -> None:
+    x = Some(1)
+    with pytest.raises(FrozenInstanceError):
+        # setattr keeps pylint from inferring `Some.value` as an int
+        setattr(x, "value", 2)
+    with pytest.raises(FrozenInstanceError):
+        del x.value  # type: ignore
+    with pytest.raises(FrozenInstanceError):
+        setattr(Null, "value", 1)
+    with pytest.raises(FrozenInstanceError):
+        delattr(Null, "value")
+
+    assert {Some(1), Some(1), Null, NullType()} == {Some(1), Null}
+    assert {Some(1): "one"}[Some(1)] == "one"
+    assert hash(Some(1)) != hash(Some(2))
@@ -1,10 +1,15 @@
+import importlib
 import os
 import sys
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections.abc import Callable, Iterator
+from dataclasses import FrozenInstanceError, dataclass
 from enum import Enum, auto
+from functools import cache, wraps
 from math import sqrt
 from pathlib import Path
+from pickle import dumps, loads
+from types import ModuleType
+from typing import NoReturn
 
 import pytest
 
@@ -16,10 +21,55 @@ from rustshed import (
     Panic,
     Result,
     Some,
+    is_ok,
     result_shortcut,
     to_io_result,
     to_result,
 )
+from rustshed.option_result import ResultShortcutError
+
+
+@to_result[ValueError]
+def parse(x: str) -> int:
+    return int(x)
+
+
+def greater_than_one(x: int) -> bool:
+    return x > 1
+
+
+checked_sqrt = to_result[ValueError](sqrt)
+
+
+@cache
+def sqrt_then_to_string(x: float) -> Result[str, str]:
+    return checked_sqrt(x).map(str).map_err(str)
+
+
+@to_io_result
+def read_to_str(path: str | Path) -> str:
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+path_stat = to_result[FileNotFoundError](os.stat)
+
+
+@pytest.fixture(name="missing_path", scope="session")
+def fixture_missing_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return tmp_path_factory.mktemp("io") / "address.txt"
+
+
+@pytest.fixture(name="root_stat", scope="session")
+def fixture_root_stat() -> Result[os.stat_result, FileNotFoundError]:
+    return path_stat("/")
+
+
+@pytest.fixture(name="missing_stat", scope="session")
+def fixture_missing_stat(
+    missing_path: Path,
+) -> Result[os.stat_result, FileNotFoundError]:
+    return path_stat(missing_path)
 
 
 def test_is_ok() -> None:
@@ -31,8 +81,6 @@ def test_is_ok() -> None:
 
 
 def test_is_ok_and() -> None:
-    greater_than_one: Callable[[int], bool] = lambda x: x > 1
-
     x: Result[int, str] = Ok(2)
     assert x.is_ok_and(greater_than_one) is True
 
@@ -56,7 +104,7 @@ def test_is_err_and() -> None:
         NotFound = auto()
         PermissionDenied = auto()
 
-    @dataclass
+    @dataclass(frozen=True, slots=True)
     class Error:
         kind: ErrorKind
 
@@ -77,12 +125,12 @@ def test_ok() -> None:
     assert x.ok() == Some(2)
 
     x = Err("Nothing here")
-    assert x.ok() == Null
+    assert x.ok() is Null
 
 
 def test_err() -> None:
     x: Result[int, str] = Ok(2)
-    assert x.err() == Null
+    assert x.err() is Null
 
     x = Err("Nothing here")
     assert x.err() == Some("Nothing here")
@@ -91,21 +139,27 @@ def test_err() -> None:
 def test_map() -> None:
     numbers_as_strs = ["1", "2", "E", "A", "5"]
 
-    @to_result[ValueError]
-    def parse(x: str) -> int:
-        return int(x)
+    def square(x: int) -> int:
+        return x**2
 
-    numbers: list[int] = []
-    for number_as_str in numbers_as_strs:
-        match parse(number_as_str).map(lambda x: x**2):
-            case Ok(value):
-                numbers.append(value)
-            case Err(_):
-                continue
+    results = [parse(number_as_str).map(square) for number_as_str in numbers_as_strs]
+    numbers = [result.unwrap() for result in results if is_ok(result)]
 
     assert numbers == [1, 4, 25]
 
 
+def test_to_result_with_exception_type() -> None:
+    @to_result[KeyError]
+    def get(d: dict[str, int], key: str) -> int:
+        return d[key]
+
+    assert get({"a": 1}, "a") == Ok(1)
+    assert get({"a": 1}, "b").is_err_and(lambda err: isinstance(err, KeyError))
+
+    with pytest.raises(TypeError):
+        get([1], "a")  # type: ignore
+
+
 def test_map_or() -> None:
     x: Result[str, str] = Ok("foo")
     assert x.map_or(42, len) == 3
@@ -136,10 +190,6 @@ def test_map_err() -> None:
 
 
 def test_inspect(capsys: pytest.CaptureFixture[str]) -> None:
-    @to_result[ValueError]
-    def parse(x: str) -> int:
-        return int(x)
-
     _x: int = (
         parse("4")
         .inspect(lambda x: print(f"original: {x}"))
@@ -151,29 +201,20 @@ def test_inspect(capsys: pytest.CaptureFixture[str]) -> None:
     assert Err("foo").inspect(print) == Err("foo")
 
 
-def test_inspect_err(capsys: pytest.CaptureFixture[str]) -> None:
-    @to_io_result
-    def read_to_str(path: str | Path) -> str:
-        with open(path, encoding="utf-8") as f:
-            return f.read()
-
-    read_to_str("address.txt").inspect_err(
+def test_inspect_err(capsys: pytest.CaptureFixture[str], missing_path: Path) -> None:
+    read_to_str(missing_path).inspect_err(
         lambda e: print(f"failed to read file: {e}", file=sys.stderr)
     )
-    assert (
-        capsys.readouterr().err
-        == "failed to read file: [Errno 2] No such file or directory: 'address.txt'\n"
-    )
+    error = f"[Errno 2] No such file or directory: '{missing_path}'"
+    assert capsys.readouterr().err == f"failed to read file: {error}\n"
     assert Ok(5).inspect_err(print) == Ok(5)
 
 
 def test_expect() -> None:
     x: Result[int, str] = Err("emergency failure")
-    with pytest.raises(Panic) as panic:
+    with pytest.raises(Panic, match=r"^Testing expect$"):
         x.expect("Testing expect")
 
-    assert str(panic.value) == "Testing expect"
-
     x = Ok(42)
     assert x.expect("Should succeed") == 42
 
@@ -183,20 +224,16 @@ def test_unwrap() -> None:
     assert x.unwrap() == 2
 
     x = Err("emergency failure")
-    with pytest.raises(Panic) as panic:
+    with pytest.raises(Panic, match=r"^emergency failure$"):
         assert x.unwrap()
 
-    assert str(panic.value) == "emergency failure"
-
 
 def test_expect_err() -> None:
     x: Result[int, str] = Ok(10)
 
-    with pytest.raises(Panic) as panic:
+    with pytest.raises(Panic, match=r"^Testing expect_err: 10$"):
         assert x.expect_err("Testing expect_err")
 
-    assert str(panic.value) == "Testing expect_err: 10"
-
     x = Err("error message")
     assert x.expect_err("should fail") == "error message"
 
@@ -204,74 +241,60 @@ def test_expect_err() -> None:
 def test_unwrap_err() -> None:
     x: Result[int, str] = Ok(2)
 
-    with pytest.raises(Panic) as panic:
+    with pytest.raises(Panic, match=r"^2$"):
         assert x.unwrap_err()
 
-    assert str(panic.value) == "2"
-
     x = Err("error message")
     assert x.unwrap_err() == "error message"
 
 
-def test_and_() -> None:
-    x: Result[int, str] = Ok(2)
-    y: Result[str, str] = Err("late error")
-
-    assert x.and_(y) == Err("late error")
-
-    x = Err("early error")
-    y = Ok("foo")
-    assert x.and_(y) == Err("early error")
-
-    x = Err("not a 2")
-    y = Err("late error")
-    assert x.and_(y) == Err("not a 2")
-
-    x = Ok(2)
-    y = Ok("different result type")
-    assert x.and_(y) == Ok("different result type")
-
+@pytest.mark.parametrize(
+    "x, y, expected",
+    (
+        (Ok(2), Err("late error"), Err("late error")),
+        (Err("early error"), Ok("foo"), Err("early error")),
+        (Err("not a 2"), Err("late error"), Err("not a 2")),
+        (Ok(2), Ok("different result type"), Ok("different result type")),
+    ),
+)
+def test_and_(
+    x: Result[int, str], y: Result[str, str], expected: Result[str, str]
+) -> None:
+    assert x.and_(y) == expected
 
-def test_and_then() -> None:
-    def sqrt_then_to_string(x: float) -> Result[str, str]:
-        return to_result[ValueError](sqrt)(x).map(str).map_err(str)
 
+def test_and_then(
+    root_stat: Result[os.stat_result, FileNotFoundError],
+    missing_stat: Result[os.stat_result, FileNotFoundError],
+) -> None:
     assert Ok(16).and_then(sqrt_then_to_string) == Ok("4.0")
     assert Ok(-1).and_then(sqrt_then_to_string) == Err("math domain error")
     assert Err("not a number").and_then(sqrt_then_to_string) == Err("not a number")
 
-    def path_stat(
-        path: str | bytes | Path,
-    ) -> Result[os.stat_result, FileNotFoundError]:
-        return to_result[FileNotFoundError](os.stat)(path)
-
-    root_modified_time: Result[float, FileNotFoundError] = path_stat("/").and_then(
+    root_modified_time: Result[float, FileNotFoundError] = root_stat.and_then(
         lambda stat: Ok(stat.st_mtime)
     )
     assert root_modified_time.is_ok()
 
-    should_fail: Result[float, FileNotFoundError] = path_stat("/bad/path").and_then(
+    should_fail: Result[float, FileNotFoundError] = missing_stat.and_then(
         lambda stat: Ok(stat.st_mtime)
     )
     assert should_fail.is_err()
 
 
-def test_or() -> None:
-    x: Result[int, str] = Ok(2)
-    y: Result[int, str] = Err("late error")
-    assert x.or_(y) == Ok(2)
-
-    x = Err("Early error")
-    y = Ok(2)
-    assert x.or_(y) == Ok(2)
-
-    x = Err("not a 2")
-    y = Err("late error")
-    assert x.or_(y) == Err("late error")
-
-    x = Ok(2)
-    y = Ok(100)
-    assert x.or_(y) == Ok(2)  # type: ignore
+@pytest.mark.parametrize(
+    "x, y, expected",
+    (
+        (Ok(2), Err("late error"), Ok(2)),
+        (Err("Early error"), Ok(2), Ok(2)),
+        (Err("not a 2"), Err("late error"), Err("late error")),
+        (Ok(2), Ok(100), Ok(2)),
+    ),
+)
+def test_or(
+    x: Result[int, str], y: Result[int, str], expected: Result[int, str]
+) -> None:
+    assert x.or_(y) == expected
 
 
 def test_or_else() -> None:
@@ -329,21 +352,438 @@ def test_transpose() -> None:
     assert x.transpose() == y
 
     x = Ok(Null)
-    assert x.transpose() == Null
+    assert x.transpose() is Null
 
     x = Err("foo")
     assert x.transpose() == Some(x)
 
 
 def test_result_shortcut() -> None:
-    def sqrt_then_to_string(x: float) -> Result[str, str]:
-        return to_result[ValueError](sqrt)(x).map(str).map_err(str)
+    reached: list[str] = []
 
     @result_shortcut
     def operation(x: float) -> Result[str, str]:
         sq = sqrt_then_to_string(x).Q
-        print(sq)
+        reached.append(sq)
         return Ok(sq)
 
     assert operation(16) == Ok("4.0")
     assert operation(-2) == Err("math domain error")
+    # the rest of the body is skipped after an early return
+    assert reached == ["4.0"]
+
+
+def test_result_shortcut_returns_early_without_raising(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[float] = []
+
+    def record(x: float) -> Result[float, str]:
+        calls.append(x)
+        return Ok(x) if x >= 0 else Err("negative")
+
+    @result_shortcut
+    def operation(x: float) -> Result[float, str]:
+        first = record(x).Q
+        second: float = record(first - 10).Q
+        return Ok(second)
+
+    def fail(_: Err[str]) -> None:
+        pytest.fail("Err.Q should not be evaluated")
+
+    monkeypatch.setattr(Err, "Q", property(fail))
+
+    assert operation(12) == Ok(2)
+    assert operation(5) == Err("negative")
+    assert operation(-1) == Err("negative")
+    assert calls == [12, 2, 5, -5, -1]
+    assert operation.__wrapped__ is not operation  # type: ignore
+
+
+def test_result_shortcut_return_and_expression_statements() -> None:
+    checked: list[int] = []
+
+    def check(x: int) -> Result[None, str]:
+        checked.append(x)
+        return Ok(None) if x % 2 == 0 else Err("odd")
+
+    def make() -> Callable[[int], Result[int, str]]:
+        @result_shortcut
+        def operation(x: int) -> Result[int, str]:
+            check(x).Q  # pylint: disable=expression-not-assigned
+            return Ok(Ok(x // 2)).Q
+
+        return operation
+
+    first, second = make(), make()
+    assert first is not second
+    assert first.__code__ is second.__code__
+
+    assert first(4) == Ok(2)
+    assert second(3) == Err("odd")
+    assert checked == [4, 3]
+
+
+def test_result_shortcut_fallback() -> None:
+    exits: list[type[BaseException] | None] = []
+
+    class Recorder:
+        def __enter__(self) -> None:
+            pass
+
+        def __exit__(self, exc_type: type[BaseException] | None, *_: object) -> None:
+            exits.append(exc_type)
+
+    def helper(x: int) -> int:
+        return (Ok(x) if x else Err("zero")).Q
+
+    @result_shortcut
+    def operation(x: int) -> Result[int, str]:
+        with Recorder():
+            inner = (Ok(x) if x >= 0 else Err("negative")).Q
+        return Ok(helper(inner))
+
+    assert operation(1) == Ok(1)
+    assert operation(0) == Err("zero")
+    assert operation(-1) == Err("negative")
+    # `.Q` inside the `with` block still unwinds it with an exception
+    assert exits == [None, None, ResultShortcutError]
+
+    lambda_operation: Callable[[], Result[int, str]] = result_shortcut(
+        lambda: Ok(Err("lambda").Q)
+    )
+    assert lambda_operation() == Err("lambda")
+
+
+@pytest.fixture(name="raised")
+def fixture_raised(monkeypatch: pytest.MonkeyPatch) -> list[object]:
+    """Records the errors for which `Err.Q` raised `ResultShortcutError`."""
+    raised: list[object] = []
+
+    def raise_recorded(err: Err[object]) -> NoReturn:
+        raised.append(err.error)
+        raise ResultShortcutError(err)
+
+    monkeypatch.setattr(Err, "Q", property(raise_recorded))
+    return raised
+
+
+def test_result_shortcut_does_not_rewrite_generators() -> None:
+    def values(x: int) -> Iterator[int]:
+        value = (Ok(x) if x else Err("zero")).Q
+        yield value
+
+    shortcut_values: Callable[[int], Iterator[int]] = result_shortcut(
+        values  # type: ignore
+    )
+
+    assert list(shortcut_values(1)) == [1]
+    # the exception is raised while iterating, outside of the decorator
+    with pytest.raises(ResultShortcutError):
+        list(shortcut_values(0))
+
+
+def test_result_shortcut_does_not_rewrite_methods_using_super(
+    raised: list[object],
+) -> None:
+    class Base:  # pylint: disable=too-few-public-methods
+        def check(self, x: int) -> Result[int, str]:
+            return Ok(x) if x >= 0 else Err("negative")
+
+    class Child(Base):  # pylint: disable=too-few-public-methods
+        @result_shortcut
+        def check(self, x: int) -> Result[int, str]:
+            value = super().check(x).Q
+            return Ok(value + 1)
+
+    assert Child().check(1) == Ok(2)
+    assert Child().check(-1) == Err("negative")
+    assert raised == ["negative"]
+
+
+def test_result_shortcut_does_not_rewrite_private_names(
+    raised: list[object],
+) -> None:
+    class Account:  # pylint: disable=too-few-public-methods
+        def __init__(self, balance: Result[int, str]) -> None:
+            self.__balance = balance
+
+        @result_shortcut
+        def balance(self) -> Result[int, str]:
+            value = self.__balance.Q
+            return Ok(value)
+
+    assert Account(Ok(5)).balance() == Ok(5)
+    assert Account(Err("closed")).balance() == Err("closed")
+    assert raised == ["closed"]
+
+
+def test_result_shortcut_does_not_rewrite_wrapped_functions(
+    raised: list[object],
+) -> None:
+    calls: list[int] = []
+
+    def logged(
+        f: Callable[[int], Result[int, str]],
+    ) -> Callable[[int], Result[int, str]]:
+        @wraps(f)
+        def inner(x: int) -> Result[int, str]:
+            calls.append(x)
+            return f(x)
+
+        return inner
+
+    @result_shortcut
+    @logged
+    def operation(x: int) -> Result[int, str]:
+        value = (Ok(x) if x else Err("zero")).Q
+        return Ok(value)
+
+    assert operation(1) == Ok(1)
+    assert operation(0) == Err("zero")
+    assert calls == [1, 0]
+    assert raised == ["zero"]
+
+
+def test_result_shortcut_does_not_rewrite_q_in_try(raised: list[object]) -> None:
+    caught: list[int] = []
+
+    @result_shortcut
+    def operation(x: int) -> Result[int, str]:
+        try:
+            value = (Ok(x) if x else Err("zero")).Q
+        except ResultShortcutError:
+            caught.append(x)
+            raise
+        return Ok(value)
+
+    assert operation(1) == Ok(1)
+    assert operation(0) == Err("zero")
+    # the handler still sees the exception
+    assert caught == [0]
+    assert raised == ["zero"]
+
+
+def test_result_shortcut_rewrites_q_in_match_cases(raised: list[object]) -> None:
+    @result_shortcut
+    def operation(x: int | str) -> Result[int, str]:
+        match x:
+            case int():
+                value = (Ok(x) if x >= 0 else Err("negative")).Q
+            case _:
+                value = parse(x).map_err(str).Q
+        return Ok(value)
+
+    assert operation(1) == Ok(1)
+    assert operation("2") == Ok(2)
+    assert operation(-1) == Err("negative")
+    assert operation("x") == Err("invalid literal for int() with base 10: 'x'")
+    assert not raised
+
+
+def import_then_edit(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    source: str,
+    edited: str | None = None,
+) -> ModuleType:
+    """Imports a module with `source` and then overwrites its file with `edited`."""
+    path = tmp_path / "edited_module.py"
+    path.write_text(source)
+    monkeypatch.setattr(sys, "path", [str(tmp_path), *sys.path])
+    monkeypatch.delitem(sys.modules, "edited_module", raising=False)
+    module = importlib.import_module("edited_module")
+    if edited is not None:
+        path.write_text(edited)
+    return module
+
+
+def test_result_shortcut_ignores_edited_source(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source = (
+        "from rustshed import Ok\n"
+        "\n"
+        "def operation(x):\n"
+        "    y = Ok(x).Q\n"
+        "    return Ok(y + 1)\n"
+    )
+    edited = source.replace("y + 1", "y * 1000")
+    module = import_then_edit(tmp_path, monkeypatch, source, edited)
+
+    # the source no longer matches the loaded code, so it is not recompiled
+    assert result_shortcut(module.operation)(2) == Ok(3)
+
+
+def test_result_shortcut_ignores_renamed_parameters(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source = (
+        "from rustshed import Ok\n"
+        "\n"
+        "def operation(a):\n"
+        "    y = Ok(a).Q\n"
+        "    return Ok(y + 1)\n"
+    )
+    edited = source.replace("(a)", "(b)")
+    module = import_then_edit(tmp_path, monkeypatch, source, edited)
+
+    # the bytecode is the same, but the edited signature is not
+    assert result_shortcut(module.operation)(a=2) == Ok(3)
+
+
+def test_result_shortcut_ignores_edited_flags(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source = (
+        "from rustshed import Ok\n"
+        "\n"
+        "def operation(x, *rest):\n"
+        "    y = Ok(x).Q\n"
+        "    return Ok(y + 1)\n"
+    )
+    # only the flags tell `*rest` and `**rest` apart
+    edited = source.replace("*rest", "**rest")
+    module = import_then_edit(tmp_path, monkeypatch, source, edited)
+
+    assert result_shortcut(module.operation)(2, 3) == Ok(3)
+
+
+def test_result_shortcut_ignores_edited_constants(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source = (
+        "from rustshed import Ok\n"
+        "\n"
+        "def operation(x):\n"
+        "    y = Ok(x).Q\n"
+        "    return Ok((lambda v: v + 1)(y))\n"
+    )
+    # only a constant of the nested lambda changes, the bytecode stays the same
+    edited = source.replace("v + 1", "v + 2")
+    module = import_then_edit(tmp_path, monkeypatch, source, edited)
+
+    assert result_shortcut(module.operation)(2) == Ok(3)
+
+
+def test_result_shortcut_with_several_statements_on_the_line(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, raised: list[object]
+) -> None:
+    module = import_then_edit(
+        tmp_path,
+        monkeypatch,
+        "from rustshed import Err, Ok\n"
+        "\n"
+        "operation = lambda: Ok(Err('error').Q); unused = None\n",
+    )
+
+    assert result_shortcut(module.operation)() == Err("error")
+    assert raised == ["error"]
+
+
+def test_result_shortcut_without_source(raised: list[object]) -> None:
+    namespace: dict[str, Callable[[Result[int, str]], Result[int, str]]] = {}
+    exec(  # pylint: disable=exec-used
+        "def operation(x):\n    y = x.Q\n    return Ok(y)\n",
+        {"Ok": Ok},
+        namespace,
+    )
+    operation = result_shortcut(namespace["operation"])
+
+    assert operation(Ok(1)) == Ok(1)
+    assert operation(Err("error")) == Err("error")
+    assert raised == ["error"]
+
+
+def test_result_shortcut_rewrites_q_in_nested_blocks(raised: list[object]) -> None:
+    def step(x: int) -> Result[int, str]:
+        return Ok(x) if x >= 0 else Err(f"{x} is negative")
+
+    @result_shortcut
+    def operation(xs: list[int]) -> Result[int, str]:
+        total = 0
+        for x in xs:
+            if x >= 100:
+                value = step(200 - x).Q
+            elif x > 0:
+                value = step(x).Q
+            elif x == 0:
+                break
+            else:
+                value = step(x).Q
+            total += value
+        else:
+            step(total - 10).Q  # pylint: disable=expression-not-assigned
+        while total > 20:
+            total = step(total - 30).Q
+        return Ok(total)
+
+    assert operation([150]) == Ok(20)
+    assert operation([250]) == Err("-50 is negative")
+    assert operation([45]) == Ok(15)
+    assert operation([105, 5, 0]) == Ok(10)
+    assert operation([-1]) == Err("-1 is negative")
+    assert operation([3]) == Err("-7 is negative")
+    assert operation([55]) == Err("-5 is negative")
+    assert not raised
+
+
+def test_results_have_no_instance_dict() -> None:
+    assert not hasattr(Ok(1), "__dict__")
+    assert not hasattr(Err(1), "__dict__")
+
+
+def test_q_without_result_shortcut() -> None:
+    err = Err("error")
+    with pytest.raises(
+        ResultShortcutError[str], match="without rustshed.result_shortcut"
+    ) as exc_info:
+        err.Q  # pylint: disable=pointless-statement
+    assert exc_info.value.error is err
+
+
+def test_to_result_shares_constant_results() -> None:
+    @to_result
+    def identity(x: object) -> object:
+        return x
+
+    for value in (None, True, False):
+        assert identity(value) == Ok(value)
+        assert identity(value) is identity(value)
+    assert identity(1) == Ok(1)
+
+
+def test_results_are_immutable_and_hashable() -> None:
+    x = Ok(1)
+    y = Err(1)
+    with pytest.raises(FrozenInstanceError):
+        # setattr keeps pylint from inferring `Ok.value` as an int
+        setattr(x, "value", 2)
+    with pytest.raises(FrozenInstanceError):
+        del y.error  # type: ignore
+    with pytest.raises(FrozenInstanceError):
+        del x.value  # type: ignore
+    with pytest.raises(FrozenInstanceError):
+        setattr(y, "error", 2)
+
+    assert {Ok(1), Ok(1), Err(1), Err(1)} == {Ok(1), Err(1)}
+    assert hash(Ok(1)) != hash(Err(1))
+    assert {Err("e"): "error"}[Err("e")] == "error"
+
+
+def test_results_are_equal_only_to_the_same_variant() -> None:
+    assert Ok(1) != Err(1)
+    assert Err(1) != Ok(1)
+    assert Ok(1) != Some(1)
+    assert Err(1) != Some(1)
+
+
+def test_result_repr() -> None:
+    assert repr(Ok(1)) == "Ok(value=1)"
+    assert repr(Err("error")) == "Err(error='error')"
+
+
+def test_results_pickle_round_trip() -> None:
+    assert loads(dumps(Ok(1))) == Ok(1)
+    assert loads(dumps(Err("error"))) == Err("error")
+    assert loads(dumps(Ok(Err(1)))) == Ok(Err(1))